@@ -7,20 +7,48 @@ or updates resume objects through the local app API.
 
 from __future__ import annotations
 
+import copy
+import functools
+import http.client
 import json
+import mmap
+import os
 import re
 import sys
+import threading
 import unicodedata
-import urllib.error
 import urllib.parse
-import urllib.request
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from pypdf import PdfReader
 
-API_BASE = "http://127.0.0.1:4100"
+# pypdfium2 wraps PDFium (C++) and extracts text roughly an order of magnitude
+# faster than pure-Python pypdf; fall back to pypdf when it is not installed.
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# orjson (Rust) serializes the large PUT payloads several times faster than
+# stdlib json and emits bytes directly; fall back to json when not installed.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+API_HOST = "127.0.0.1"
+API_PORT = 4100
 DEFAULT_SECTION_ORDER = ["education", "skills", "openSource", "projects", "experience"]
 SECTION_TITLES = {
     "education": "Education",
@@ -29,15 +57,68 @@ SECTION_TITLES = {
     "projects": "Projects",
     "experience": "Experience",
 }
+_LOW_TO_KEY = {title.lower(): key for key, title in SECTION_TITLES.items()}
 
 MONTHS = (
     "Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|"
     "Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?"
 )
 DATE_LINE_RE = re.compile(rf"^(.*?)\s+(({MONTHS})\s+\d{{4}}\s+[–-]\s+.+)$", re.IGNORECASE)
+# Unanchored prefilter for DATE_LINE_RE: a plain substring scan for a month
+# prefix is far cheaper than running the lazy anchored pattern on every line.
+_MONTH_PREFIX_RE = re.compile(
+    r"Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec", re.IGNORECASE
+)
 PHONE_RE = re.compile(r"\b\d{3}[- ]\d{3}[- ]\d{4}\b")
 EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 
+# Intern the dict keys repeated across the thousands of small payload dicts
+# built per resume, so key hashing during JSON serialization takes the
+# identity fast path and duplicate key strings share storage.
+for _k in (
+    "id",
+    "text",
+    "institution",
+    "rightMeta",
+    "degree",
+    "detail",
+    "label",
+    "value",
+    "title",
+    "dateRange",
+    "role",
+    "link",
+    "pointIds",
+    "localId",
+    "company",
+    "location",
+):
+    sys.intern(_k)
+
+
+def _has_date(line: str) -> bool:
+    return _MONTH_PREFIX_RE.search(line) is not None
+
+
+# Extraction artifacts fixed before the whitespace collapse, and common OCR
+# splits fixed after it (so tabs and multi-space runs inside a split still
+# match) \u2014 each in one scan instead of a chain of str.replace passes. Longest
+# keys first so e.g. "CU-BioF rontiers" wins over the bare "BioF rontiers".
+_PRE_FIXUPS = {
+    "\u00a0": " ",
+    "/gtb": "",
+    " A WS": " AWS",
+}
+_PRE_FIXUP_RE = re.compile("|".join(re.escape(k) for k in sorted(_PRE_FIXUPS, key=len, reverse=True)))
+_OCR_FIXUPS = {
+    "W eb": "Web",
+    "T ools": "Tools",
+    "A gentic": "Agentic",
+    "CU-BioF rontiers": "CU-BioFrontiers",
+    "BioF rontiers": "BioFrontiers",
+}
+_OCR_FIXUP_RE = re.compile("|".join(re.escape(k) for k in sorted(_OCR_FIXUPS, key=len, reverse=True)))
+
 
 @dataclass
 class ParsedResume:
@@ -51,67 +132,80 @@ class ParsedResume:
     section_order: list[str]
 
 
+# One keep-alive connection per thread to the local API: every request
+# otherwise pays a fresh TCP handshake, which dominates latency on loopback.
+# http.client connections are not thread-safe, hence the thread-local.
+_CONN_LOCAL = threading.local()
+
+
+def _get_connection() -> http.client.HTTPConnection:
+    conn = getattr(_CONN_LOCAL, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPConnection(API_HOST, API_PORT, timeout=60)
+        _CONN_LOCAL.conn = conn
+    return conn
+
+
 def api_request(method: str, path: str, payload: dict[str, Any] | None = None) -> Any:
-    url = f"{API_BASE}{path}"
     data = None
-    headers = {"Content-Type": "application/json"}
+    headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
     if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
+        data = _dumps(payload)
+
+    # Retry once with a fresh connection if the server closed the idle
+    # socket, but only for idempotent methods: the failure can surface in
+    # getresponse() after the server already processed the request, and
+    # replaying a POST there would create a duplicate resume.
+    attempts = 2 if method in ("GET", "PUT") else 1
+    for attempt in range(attempts):
+        conn = _get_connection()
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+            break
+        except (http.client.BadStatusLine, ConnectionError, BrokenPipeError):
+            conn.close()
+            _CONN_LOCAL.conn = None
+            if attempt == attempts - 1:
+                raise
 
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
-    try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"API error {exc.code} on {path}: {body}") from exc
+    if resp.status >= 400:
+        raise RuntimeError(f"API error {resp.status} on {path}: {body.decode('utf-8', errors='replace')}")
+    return _loads(body)
 
 
 def normalize_line(line: str) -> str:
-    line = unicodedata.normalize("NFKC", line)
-    line = line.replace("\u00a0", " ")
-    line = line.replace("/gtb", "")
-    line = line.replace(" A WS", " AWS")
+    # Quick-check first: most resume lines are pure ASCII, which is already
+    # NFKC, so the full decompose/recompose pass can usually be skipped.
+    if not unicodedata.is_normalized("NFKC", line):
+        line = unicodedata.normalize("NFKC", line)
+    line = _PRE_FIXUP_RE.sub(lambda m: _PRE_FIXUPS[m.group(0)], line)
     line = re.sub(r"\s+", " ", line).strip()
-
     # Fix common OCR splits without collapsing legitimate article spacing.
-    line = line.replace("W eb", "Web")
-    line = line.replace("T ools", "Tools")
-    line = line.replace("A gentic", "Agentic")
-    line = line.replace("CU-BioF rontiers", "CU-BioFrontiers")
-    line = line.replace("BioF rontiers", "BioFrontiers")
-
-    return line
+    return _OCR_FIXUP_RE.sub(lambda m: _OCR_FIXUPS[m.group(0)], line)
 
 
-def normalize_lines(text: str) -> list[str]:
+def normalize_lines(raw_lines: Iterable[str]) -> list[str]:
     lines: list[str] = []
-    for raw in text.splitlines():
+    for raw in raw_lines:
         line = normalize_line(raw)
         if line:
             lines.append(line)
     return lines
 
 
-def split_sections(lines: list[str]) -> tuple[list[str], dict[str, list[str]]]:
+def split_sections(lines: list[str]) -> tuple[int, list[str], dict[str, list[str]]]:
     section_indices: list[tuple[int, str]] = []
     for i, line in enumerate(lines):
-        low = line.lower()
-        if low == "education":
-            section_indices.append((i, "education"))
-        elif low == "skills":
-            section_indices.append((i, "skills"))
-        elif low == "open source contributions":
-            section_indices.append((i, "openSource"))
-        elif low == "projects":
-            section_indices.append((i, "projects"))
-        elif low == "experience":
-            section_indices.append((i, "experience"))
+        key = _LOW_TO_KEY.get(line.lower())
+        if key is not None:
+            section_indices.append((i, key))
 
     if not section_indices:
         raise RuntimeError("Could not detect section headers in PDF text")
 
-    section_indices = sorted(section_indices, key=lambda x: x[0])
+    # Indices are appended in ascending order by construction.
     section_map: dict[str, list[str]] = {}
     for idx, (start, key) in enumerate(section_indices):
         end = section_indices[idx + 1][0] if idx + 1 < len(section_indices) else len(lines)
@@ -122,7 +216,7 @@ def split_sections(lines: list[str]) -> tuple[list[str], dict[str, list[str]]]:
         if key not in order:
             order.append(key)
 
-    return order, section_map
+    return section_indices[0][0], order, section_map
 
 
 def parse_header(lines: list[str], first_section_index: int) -> dict[str, str]:
@@ -217,19 +311,22 @@ def parse_skills(lines: list[str]) -> list[dict[str, str]]:
 
 def parse_bullets(lines: list[str]) -> list[str]:
     bullets: list[str] = []
-    current: str | None = None
+    # Accumulate fragments per bullet and join once at flush time, instead of
+    # quadratic += string concatenation on wrapped lines.
+    current: list[str] | None = None
 
     for line in lines:
-        if line.startswith("•"):
+        if line[:1] == "•":
             if current:
-                bullets.append(current.strip())
-            current = line[1:].strip()
+                bullets.append(" ".join(current).strip())
+            text = line[1:].strip()
+            current = [text] if text else None
         else:
             if current:
-                current += f" {line.strip()}"
+                current.append(line.strip())
 
     if current:
-        bullets.append(current.strip())
+        bullets.append(" ".join(current).strip())
 
     return bullets
 
@@ -249,7 +346,7 @@ def parse_open_source(lines: list[str]) -> list[dict[str, Any]]:
         return []
 
     first = lines[0]
-    m = DATE_LINE_RE.match(first)
+    m = DATE_LINE_RE.match(first) if _has_date(first) else None
     title = first
     date_range = ""
     if m:
@@ -258,7 +355,7 @@ def parse_open_source(lines: list[str]) -> list[dict[str, Any]]:
 
     role = ""
     bullet_start = 1
-    if len(lines) > 1 and not lines[1].startswith("•"):
+    if len(lines) > 1 and lines[1][:1] != "•":
         role = lines[1].strip()
         bullet_start = 2
 
@@ -278,11 +375,14 @@ def parse_open_source(lines: list[str]) -> list[dict[str, Any]]:
 
 def parse_projects(lines: list[str]) -> list[dict[str, Any]]:
     projects: list[dict[str, Any]] = []
+    _date_match = DATE_LINE_RE.match
     i = 0
     while i < len(lines):
         line = lines[i]
-        m = DATE_LINE_RE.match(line)
-        if not m or line.startswith("•"):
+        # Cheap bullet test first so the month alternation never runs on
+        # bullet lines, which dominate the section.
+        m = _date_match(line) if line[:1] != "•" and _has_date(line) else None
+        if not m:
             i += 1
             continue
 
@@ -298,7 +398,7 @@ def parse_projects(lines: list[str]) -> list[dict[str, Any]]:
         bullet_lines: list[str] = []
         while i < len(lines):
             candidate = lines[i]
-            if DATE_LINE_RE.match(candidate) and not candidate.startswith("•"):
+            if candidate[:1] != "•" and _has_date(candidate) and _date_match(candidate):
                 break
             bullet_lines.append(candidate)
             i += 1
@@ -321,7 +421,7 @@ def parse_experience(lines: list[str]) -> list[dict[str, Any]]:
         return []
 
     line0 = lines[0]
-    m = DATE_LINE_RE.match(line0)
+    m = DATE_LINE_RE.match(line0) if _has_date(line0) else None
     company = line0
     date_range = ""
     if m:
@@ -330,7 +430,7 @@ def parse_experience(lines: list[str]) -> list[dict[str, Any]]:
 
     role = ""
     bullet_start = 1
-    if len(lines) > 1 and not lines[1].startswith("•"):
+    if len(lines) > 1 and lines[1][:1] != "•":
         role = lines[1].strip()
         bullet_start = 2
 
@@ -346,16 +446,19 @@ def parse_experience(lines: list[str]) -> list[dict[str, Any]]:
     ]
 
 
-def latex_escape(text: str) -> str:
-    text = text.strip()
-    text = text.replace("\u2013", "--")
-    text = text.replace("\u2014", "--")
-    text = text.replace("\u02dc", "~")
-    text = text.replace("×", "x")
-    text = text.replace("→", "->")
-    text = text.replace("“", '"').replace("”", '"').replace("’", "'")
-
-    repl = {
+# Escape table applied in one C-level pass instead of a per-character Python
+# loop. The Unicode fixups share the table (maketrans allows multi-character
+# targets), with the small tilde mapped straight to its escaped form.
+_LATEX_TABLE = str.maketrans(
+    {
+        "\u2013": "--",
+        "\u2014": "--",
+        "\u02dc": r"\textasciitilde{}",
+        "×": "x",
+        "→": "->",
+        "“": '"',
+        "”": '"',
+        "’": "'",
         "\\": r"\textbackslash{}",
         "&": r"\&",
         "%": r"\%",
@@ -367,7 +470,14 @@ def latex_escape(text: str) -> str:
         "~": r"\textasciitilde{}",
         "^": r"\textasciicircum{}",
     }
-    return "".join(repl.get(ch, ch) for ch in text)
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def latex_escape(text: str) -> str:
+    # Pure function over small strings, and imports repeat the same labels,
+    # institutions and empty fields constantly, so memoizing pays off.
+    return text.strip().translate(_LATEX_TABLE)
 
 
 def href_latex(url: str, label: str) -> str:
@@ -377,19 +487,34 @@ def href_latex(url: str, label: str) -> str:
     return f"\\href{{{url}}}{{{safe_label}}}"
 
 
-def parse_pdf(pdf_path: Path) -> ParsedResume:
-    reader = PdfReader(str(pdf_path))
-    text = "\n".join((page.extract_text() or "") for page in reader.pages)
-    lines = normalize_lines(text)
+def iter_pdf_page_texts(pdf_path: Path) -> Iterator[str]:
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            for page in pdf:
+                yield page.get_textpage().get_text_range()
+        finally:
+            pdf.close()
+        return
+
+    # Memory-map the file for pypdf so its seek-heavy reads hit the kernel
+    # page cache zero-copy; mmap supports the read/seek/tell stream interface
+    # pypdf expects.
+    with open(pdf_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        reader = PdfReader(mm)
+        for page in reader.pages:
+            yield page.extract_text() or ""
 
-    first_section_index = len(lines)
-    for i, line in enumerate(lines):
-        if line in SECTION_TITLES.values():
-            first_section_index = i
-            break
 
+def parse_pdf(pdf_path: Path) -> ParsedResume:
+    # Feed pages straight into line normalization instead of joining all page
+    # text into one big intermediate string first.
+    lines = normalize_lines(
+        raw for text in iter_pdf_page_texts(pdf_path) for raw in text.splitlines()
+    )
+
+    first_section_index, order, section_map = split_sections(lines)
     header = parse_header(lines, first_section_index)
-    order, section_map = split_sections(lines)
 
     return ParsedResume(
         name=pdf_path.stem,
@@ -403,12 +528,14 @@ def parse_pdf(pdf_path: Path) -> ParsedResume:
     )
 
 
-def rid(prefix: str, idx: int, item_idx: int) -> str:
-    return f"{prefix}_{idx:02d}_{item_idx:02d}"
+def build_resume_payload(base_resume: dict[str, Any], parsed: ParsedResume, index: int) -> dict[str, Any]:
+    # Format the resume index once; it is shared by every ID minted below.
+    idx_str = f"{index:02d}"
 
+    def rid(prefix: str, item_idx: int) -> str:
+        return f"{prefix}_{idx_str}_{item_idx:02d}"
 
-def build_resume_payload(base_resume: dict[str, Any], parsed: ParsedResume, index: int) -> dict[str, Any]:
-    resume = json.loads(json.dumps(base_resume))
+    resume = copy.deepcopy(base_resume)
 
     resume["name"] = parsed.name
     resume["headerMode"] = "local"
@@ -444,7 +571,7 @@ def build_resume_payload(base_resume: dict[str, Any], parsed: ParsedResume, inde
     }
 
     for j, edu in enumerate(parsed.education):
-        eid = rid("ledu", index, j)
+        eid = rid("ledu", j)
         local["education"].append({
             "id": eid,
             "institution": latex_escape(edu["institution"]),
@@ -455,7 +582,7 @@ def build_resume_payload(base_resume: dict[str, Any], parsed: ParsedResume, inde
         sections["education"].append({"localId": eid})
 
     for j, skill in enumerate(parsed.skills):
-        sid = rid("lskill", index, j)
+        sid = rid("lskill", j)
         local["skills"].append({
             "id": sid,
             "label": latex_escape(skill["label"]),
@@ -464,10 +591,10 @@ def build_resume_payload(base_resume: dict[str, Any], parsed: ParsedResume, inde
         sections["skills"].append({"localId": sid})
 
     for j, entry in enumerate(parsed.open_source):
-        oid = rid("los", index, j)
+        oid = rid("los", j)
         point_ids: list[str] = []
         for k, point in enumerate(entry["points"]):
-            pid = rid("lp", index, j * 20 + k)
+            pid = rid("lp", j * 20 + k)
             local["points"][pid] = {"id": pid, "text": latex_escape(point)}
             point_ids.append(pid)
 
@@ -484,10 +611,10 @@ def build_resume_payload(base_resume: dict[str, Any], parsed: ParsedResume, inde
         sections["openSource"].append({"localId": oid})
 
     for j, entry in enumerate(parsed.projects):
-        pid_entry = rid("lproj", index, j)
+        pid_entry = rid("lproj", j)
         point_ids: list[str] = []
         for k, point in enumerate(entry["points"]):
-            pid = rid("lp", index, 100 + j * 20 + k)
+            pid = rid("lp", 100 + j * 20 + k)
             local["points"][pid] = {"id": pid, "text": latex_escape(point)}
             point_ids.append(pid)
 
@@ -503,10 +630,10 @@ def build_resume_payload(base_resume: dict[str, Any], parsed: ParsedResume, inde
         sections["projects"].append({"localId": pid_entry})
 
     for j, entry in enumerate(parsed.experience):
-        xid = rid("lexp", index, j)
+        xid = rid("lexp", j)
         point_ids: list[str] = []
         for k, point in enumerate(entry["points"]):
-            pid = rid("lp", index, 200 + j * 30 + k)
+            pid = rid("lp", 200 + j * 30 + k)
             local["points"][pid] = {"id": pid, "text": latex_escape(point)}
             point_ids.append(pid)
 
@@ -551,24 +678,46 @@ def import_folder(folder: Path) -> None:
     if not pdfs:
         raise RuntimeError(f"No PDFs found in {folder}")
 
-    for idx, pdf in enumerate(pdfs):
-        parsed = parse_pdf(pdf)
-        resume_id = ensure_resume(parsed.name, source_resume_id, existing_by_name)
-
-        detail = api_request("GET", f"/api/resumes/{urllib.parse.quote(resume_id)}")
-        base_resume = detail["resume"]
-        payload = build_resume_payload(base_resume, parsed, idx)
-
-        api_request(
-            "PUT",
-            f"/api/resumes/{urllib.parse.quote(resume_id)}",
-            {
-                "resume": payload,
-                "message": f"Import content from PDF: {pdf.name}",
-            },
-        )
-
-        print(f"Imported: {pdf.name} -> {parsed.name} ({resume_id})")
+    # Parsing is CPU-bound, so fan it out across processes, and prefetch the
+    # read-only base-resume GETs through a small thread pool so they overlap
+    # parsing. Every mutating call (the POST in ensure_resume, the PUT below)
+    # stays serialized on the main thread: the backend update path is a
+    # read-modify-write over shared state files plus a git commit, and cannot
+    # take concurrent mutations.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex, ThreadPoolExecutor(max_workers=4) as get_pool:
+        pending: deque[tuple[int, Path, ParsedResume, str, Any]] = deque()
+        # PDFs that resolve to the same resume share one base GET; each id is
+        # only written once per run, so a cached base is never stale.
+        base_futures: dict[str, Any] = {}
+
+        def flush_one() -> None:
+            idx, pdf, parsed, resume_id, get_future = pending.popleft()
+            base_resume = get_future.result()["resume"]
+            payload = build_resume_payload(base_resume, parsed, idx)
+            api_request(
+                "PUT",
+                f"/api/resumes/{urllib.parse.quote(resume_id)}",
+                {
+                    "resume": payload,
+                    "message": f"Import content from PDF: {pdf.name}",
+                },
+            )
+            print(f"Imported: {pdf.name} -> {parsed.name} ({resume_id})")
+
+        for idx, (pdf, parsed) in enumerate(zip(pdfs, ex.map(parse_pdf, pdfs, chunksize=2))):
+            resume_id = ensure_resume(parsed.name, source_resume_id, existing_by_name)
+            get_future = base_futures.get(resume_id)
+            if get_future is None:
+                get_future = get_pool.submit(
+                    api_request, "GET", f"/api/resumes/{urllib.parse.quote(resume_id)}"
+                )
+                base_futures[resume_id] = get_future
+            pending.append((idx, pdf, parsed, resume_id, get_future))
+            if len(pending) >= 4:
+                flush_one()
+
+        while pending:
+            flush_one()
 
 
 def main() -> None: